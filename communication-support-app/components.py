@@ -43,16 +43,20 @@ def render_header() -> None:
     )
 
 
+# モード別のレベル選択肢ラベル（import 時に一度だけ構築）
+_LEVEL_LABELS: Dict[Mode, Dict[str, str]] = {
+    Mode.AA36: LEVEL_LABELS_AA36,
+    Mode.ITTAKU: LEVEL_LABELS_ITTAKU,
+    Mode.VILLAIN: LEVEL_LABELS_VILLAIN,
+}
+
+
 def _level_labels_for_mode(mode: Mode) -> Dict[str, str]:
     """
     モード別のレベル選択肢ラベルを返す。
     UI 用のみに使用。
     """
-    if mode == Mode.AA36:
-        return LEVEL_LABELS_AA36
-    if mode == Mode.ITTAKU:
-        return LEVEL_LABELS_ITTAKU
-    return LEVEL_LABELS_VILLAIN
+    return _LEVEL_LABELS[mode]
 
 
 def render_sidebar_controls() -> Dict[str, Any]:
@@ -91,6 +95,7 @@ def render_sidebar_controls() -> Dict[str, Any]:
             type="primary",
         ):
             st.session_state["used_prompt_ids"] = {}
+            st.session_state["gen_counter"] += 1
             st.toast("次のお題を生成しました。", icon="✨")
 
         # モード×レベル単位で dedup_key を付与（外部I/Fへ渡す）
@@ -109,6 +114,14 @@ def render_sidebar_controls() -> Dict[str, Any]:
 # ============================================================================ #
 # Prompt Cards
 # ============================================================================ #
+# モード別のセクション見出し
+_HEADING_BY_MODE: Dict[Mode, str] = {
+    Mode.AA36: "### 質問",
+    Mode.ITTAKU: "### お題",
+    Mode.VILLAIN: "### お題",
+}
+
+
 def render_prompt_cards(
     prompts: List[str],
     mode: Mode,
@@ -121,15 +134,11 @@ def render_prompt_cards(
     st.markdown("---")
 
     # セクション見出し
-    if len(prompts) == 3:
-        st.markdown("### 質問")
-    else:
-        st.markdown("### お題")
+    st.markdown(_HEADING_BY_MODE[mode])
 
     # 各質問/お題のカード表示
-    for i, p in enumerate(prompts, start=1):
-        with st.container():
-            st.code(p, language="markdown")
+    for p in prompts:
+        st.code(p, language="markdown")
 
 
 # ============================================================================ #
@@ -151,5 +160,5 @@ def render_mode_help(mode: ct.Mode) -> None:
     # 詳細な遊び方は折りたたみ内に格納
     if help_data.notes:
         with st.expander("遊び方", expanded=True):
-            for note in help_data.notes:
-                st.markdown(f"- {note}")
+            # 箇条書きは1回の markdown にまとめて描画（要素数を抑える）
+            st.markdown("\n".join(f"- {note}" for note in help_data.notes))
@@ -14,7 +14,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, Tuple
 from dataclasses import dataclass
 from enum import Enum, auto
 
@@ -103,7 +103,7 @@ LEVEL_LABELS_VILLAIN: Dict[str, str] = {
 
 # 36の質問（日本語要約）。1–12: 初級 / 13–24: 中級 / 25–36: 上級。
 # 「business」は別配列で安全表現に言い換え。
-AA36_QUESTIONS: List[str] = [
+AA36_QUESTIONS: Tuple[str, ...] = (
     # 1–12: 初級
     "世界中の誰でもディナーに招けるとしたら、誰を招きたいですか？",
     "有名になりたいですか？それはどのような形で？",
@@ -143,10 +143,10 @@ AA36_QUESTIONS: List[str] = [
     "家が火事になり大切な人とペットを救った後、もう1つだけ持ち出せるとしたら何を選びますか？なぜですか？",
     "家族の中で誰の死が最もつらいと思いますか？なぜですか？",
     "個人的な悩みを1つ共有し、相手に「あなたならどうする？」と尋ねてください。その後、相手にあなたの感情を言い返してもらってください。",
-]
+)
 
 # 36の質問・ビジネス向け
-AA36_BUSINESS_REWRITE: List[str] = [
+AA36_BUSINESS_REWRITE: Tuple[str, ...] = (
     "もし世界中の誰とでも1時間対話できるとしたら、誰を選びますか？その理由は？",
     "あなたにとって「理想的な一日」とは、どんな働き方の一日ですか？",
     "仕事で「完璧にできた」と感じた瞬間はどんな時ですか？",
@@ -159,10 +159,10 @@ AA36_BUSINESS_REWRITE: List[str] = [
     "これまでの職場で印象に残っているリーダー像を教えてください。",
     "あなたにとって「仕事での友情」とはどのような関係性ですか？",
     "もし今のチームに新メンバーを迎えるとしたら、どんな人を歓迎しますか？",
-]
+)
 
 # 結論！実際それ一択のテーマ
-ITTAKU_TOPICS: List[str] = [
+ITTAKU_TOPICS: Tuple[str, ...] = (
     "理想の朝の過ごし方といえば？",
     "この季節に欠かせないものといえば？",
     "年末夜の過ごし方といえば？",
@@ -174,10 +174,10 @@ ITTAKU_TOPICS: List[str] = [
     "おすすめのガジェットは？",
     "一番ほっこりする瞬間といえば？"
     "これだけは出費を惜しまないものといえば？"
-]
+)
 
 # 結論！実際それ一択のテーマ・ビジネス向け
-ITTAKU_BUSINESS_TOPICS: List[str] = [
+ITTAKU_BUSINESS_TOPICS: Tuple[str, ...] = (
     "理想の金曜日の夜の過ごし方は？",
     "お土産で“相手のセンス”を感じたものは？",
     "同僚/取引先への定番の差し入れは？",
@@ -188,10 +188,10 @@ ITTAKU_BUSINESS_TOPICS: List[str] = [
     "仕事終わりのオフタイムへの切り替え法は？",
     "着手しづらい業務に取り掛かる最初の一手は？",
     "仕事が捗る“デスク環境といえば？",
-]
+)
 
 # なりきり犯罪者で使う題材
-CRIMINAL_TEMPLATE: List[str] = [
+CRIMINAL_TEMPLATE: Tuple[str, ...] = (
     "職員と利用者を人質に取り立てこもる銀行強盗犯",
     "有名美術館から名画を盗み出した実行犯",
     "大企業の顧客データを盗み出して闇市場で売るハッカー",
@@ -201,10 +201,10 @@ CRIMINAL_TEMPLATE: List[str] = [
     "海外から麻薬をスーツケースで密輸しようとした密輸人",
     "高級ブランドの偽造品を大量に流通させた犯罪者",
     "選挙結果を操作するための買収した政治家",
-]
+)
 
 # こじつけクレーマーで使う題材
-COMPLAINER_TEMPLATE: List[str] = [
+COMPLAINER_TEMPLATE: Tuple[str, ...] = (
     "混雑するランチタイムに料理の提供まで20分待たされたレストラン",
     "台風の影響で宅配便の到着が予定より1日遅れた通販注文",
     "営業時間ジャストに開店したスーパーに入店しようとして数十秒待たされたケース",
@@ -215,4 +215,4 @@ COMPLAINER_TEMPLATE: List[str] = [
     "無料Wi-Fiの速度が低速だったカフェ",
     "開店時間に間に合わず初売りの福袋が買えなかった客",
     "高価なスポーツ用具を購入したのに試合結果が振るわなかった人"
-]
+)
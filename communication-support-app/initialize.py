@@ -6,8 +6,10 @@
 - 既存値があれば保持し、未定義の場合のみ既定値を設定
 
 カギとなるセッションキー：
-- used_prompt_ids: {dedup_key -> set(hash(prompt_str))}   重複防止用
+- used_prompt_ids: {dedup_key -> int(プール内インデックスのビットマスク)}  重複防止用
 - history: [{ts, mode, level, prompts[], chosen}]         ログ/エクスポート用
+- gen_counter / last_prompt_key / last_prompts             再実行間のお題キャッシュ用
+- _rng / _rng:<seed>: random.Random                        再実行間で使い回す乱数生成器（utils.get_rng）
 """
 
 from __future__ import annotations
@@ -21,10 +23,13 @@ def ensure_session_state() -> None:
     既存の値は尊重し、欠損するキーのみ既定値を投入する。
     """
     defaults = {
-        "used_prompt_ids": {},  # dict[str -> set[int]]
+        "used_prompt_ids": {},  # dict[str -> int]
         "history": [],          # list[dict]
         "favorites": [],        # list[str]
         "seed_text": "",
+        "gen_counter": 0,       # 「更新」ボタン押下回数
+        "last_prompt_key": None,  # 直近生成時の (mode, level, gen_counter)
+        "last_prompts": [],     # 直近生成したお題
     }
     for k, v in defaults.items():
         if k not in st.session_state:
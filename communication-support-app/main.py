@@ -26,6 +26,13 @@ from components import (
     render_mode_help,
 )
 
+# モード別の提示件数（AA36 のみ 3 件、他は 1 件）
+_N_BY_MODE: Dict[Mode, int] = {
+    Mode.AA36: 3,
+    Mode.ITTAKU: 1,
+    Mode.VILLAIN: 1,
+}
+
 
 # ============================================================================ #
 # Streamlit ページエントリ
@@ -53,19 +60,27 @@ def page() -> None:
     # モード別の説明カードを表示
     render_mode_help(controls["mode"])
 
-    # 乱数生成器を確定（シード指定があれば再現性あり）
-    rng: random.Random = get_rng(controls["seed"])
-    n = 3 if controls["mode"] == Mode.AA36 else 1
-
-    # 指定モード/レベルで 3 件のプロンプトを生成
-    # - 「n=3」固定は仕様要件
-    prompts = get_prompts(
-        mode=controls["mode"],
-        level=controls["level"],
-        n=n,
-        rng=rng,
-        dedup_key=controls["dedup_key"],  # モード×レベル単位で重複防止
-    )
+    # 生成済みのお題を再利用するためのキー
+    # - 「更新」ボタン押下（gen_counter 加算）かモード/レベル変更時のみ再生成
+    cache_key = (controls["mode"], controls["level"], st.session_state["gen_counter"])
+    if st.session_state["last_prompt_key"] == cache_key:
+        prompts = st.session_state["last_prompts"]
+    else:
+        # 乱数生成器を確定（シード指定があれば再現性あり）
+        rng: random.Random = get_rng(controls["seed"])
+        n = _N_BY_MODE[controls["mode"]]
+
+        # 指定モード/レベルで 3 件のプロンプトを生成
+        # - 「n=3」固定は仕様要件
+        prompts = get_prompts(
+            mode=controls["mode"],
+            level=controls["level"],
+            n=n,
+            rng=rng,
+            dedup_key=controls["dedup_key"],  # モード×レベル単位で重複防止
+        )
+        st.session_state["last_prompt_key"] = cache_key
+        st.session_state["last_prompts"] = prompts
 
     # 中央カラム：各お題カード
     render_prompt_cards(
@@ -17,7 +17,7 @@ from __future__ import annotations
 import hashlib
 import random
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import streamlit as st
 
@@ -38,126 +38,169 @@ def _seed_to_int(seed: Optional[str]) -> Optional[int]:
     """
     任意文字列シードを、再現性のある安定的な int に変換する。
     - None/空文字は None を返す（=乱数に任せる）
-    - 有値の場合は SHA-256 の先頭 16hex を int 化
+    - 有値の場合は BLAKE2b（8バイト）ダイジェストを int 化
+      （暗号強度は不要なため、SHA-256 より軽量なハッシュを使用）
     """
     if not seed:
         return None
-    h = hashlib.sha256(seed.encode("utf-8")).hexdigest()
-    return int(h[:16], 16)
+    digest = hashlib.blake2b(seed.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
 
 
 def get_rng(seed: Optional[str]) -> random.Random:
     """
-    乱数生成器を返す。
-    - seed が None の場合は非決定的な乱数
-    - seed が指定されている場合は安定的な乱数系列
+    乱数生成器を返す。再実行間で同じ生成器を使い回すため、セッション内に保持する。
+    - seed が None の場合は非決定的な乱数（"_rng"）
+    - seed が指定されている場合は安定的な乱数系列（"_rng:<seed>"、セッション単位）
     """
-    s = _seed_to_int(seed)
-    if s is None:
-        return random.Random()
-    return random.Random(s)
+    key = f"_rng:{seed}" if seed else "_rng"
+    if key not in st.session_state:
+        st.session_state[key] = random.Random(_seed_to_int(seed))
+    return st.session_state[key]
 
 
 # ============================================================================ #
 # 重複防止（セッション内ユニーク管理）
 # ============================================================================ #
-def _get_used_set(dedup_key: str) -> set:
+def _get_used_mask(dedup_key: str) -> int:
     """
-    指定 dedup_key の使用済みハッシュ集合を返す。
-    無ければ空集合を新規作成。
+    指定 dedup_key の使用済みビットマスクを返す（i ビット目＝プール内 i 番目）。
+    無ければ 0（未使用）。
+    "used_prompt_ids" 自体は ensure_session_state が必ず用意している。
     """
-    used_map = st.session_state.get("used_prompt_ids", {})
-    if dedup_key not in used_map:
-        used_map[dedup_key] = set()
-        st.session_state["used_prompt_ids"] = used_map
-    return used_map[dedup_key]
+    return st.session_state["used_prompt_ids"].get(dedup_key, 0)
 
-def _mark_used(dedup_key: str, pid: int) -> None:
+def _set_used_mask(dedup_key: str, used_mask: int) -> None:
     """
-    指定 dedup_key において、アイテム識別子（pid=hash(str)）を使用済みに登録。
+    指定 dedup_key の使用済みビットマスクを更新する。
+    int は不変なので、session_state が保持する dict 側へ格納し直す。
     """
-    used_map = st.session_state["used_prompt_ids"]
-    used_map.setdefault(dedup_key, set()).add(pid)
-    st.session_state["used_prompt_ids"] = used_map
+    st.session_state["used_prompt_ids"][dedup_key] = used_mask
 
-def _sample_without_used(
-    items: List[str],
+def _draw(
+    pool_len: int,
+    used_mask: int,
     n: int,
     rng: random.Random,
-    dedup_key: str,
-) -> List[str]:
+) -> Tuple[List[int], int]:
     """
-    使用済みを避けて n 件サンプルを返す。
+    使用済みビットマスクを避けて n 件のインデックスを抽出し、
+    (抽出インデックス, 更新後のビットマスク) を返す。
     - 候補が n 件未満の場合は可能な範囲で返す（その後はフルプールから）
     - バッチ内重複を避ける（履歴の再提示は基本なし）
-    - 取得したアイテムは使用済みにマークする
     """
-    used = _get_used_set(dedup_key)
-    candidates = [s for s in items if hash(s) not in used]
+    # n=1（ITTAKU/VILLAIN）の高速経路：全件走査せず、ランダムに未使用を探す
+    # 残りがほぼ無く見つからない場合のみ、下の経路へフォールバック
+    if n == 1 and pool_len:
+        for _ in range(pool_len):
+            i = rng.randrange(pool_len)
+            if not used_mask >> i & 1:
+                return [i], used_mask | 1 << i
+
+    full_mask = (1 << pool_len) - 1
+
+    # 使用済みが少ない間（7割以下）は全件走査せず、棄却サンプリングで抽出
+    # 期待試行回数は n * L / (L - 使用済み数) 程度に収まる
+    used_count = (used_mask & full_mask).bit_count()
+    if pool_len - used_count >= n and used_count <= pool_len * 0.7:
+        picks: List[int] = []
+        while len(picks) < n:
+            i = rng.randrange(pool_len)
+            if used_mask >> i & 1:
+                continue
+            picks.append(i)
+            used_mask |= 1 << i
+        return picks, used_mask
+
+    available = full_mask & ~used_mask
+    candidates = [i for i in range(pool_len) if available >> i & 1]
 
     if len(candidates) >= n:
-        chosen = rng.sample(candidates, n)
+        # n は高々 3 と小さいため、先頭 n 件だけの部分 Fisher-Yates で抽出
+        for i in range(n):
+            j = rng.randrange(i, len(candidates))
+            candidates[i], candidates[j] = candidates[j], candidates[i]
+        picks = candidates[:n]
     else:
-        chosen = list(candidates)
-        still_need = n - len(chosen)
-        refill = items[:]  # フルプールから補充（バッチ内重複は避ける）
-        while still_need > 0 and refill:
-            pick = rng.choice(refill)
-            if pick not in chosen:
-                chosen.append(pick)
+        picks = list(candidates)
+        picked_mask = available
+        still_need = n - len(picks)
+        refill = list(range(pool_len))  # フルプールから補充（バッチ内重複は避ける）
+        rng.shuffle(refill)
+        for pick in refill:
+            if still_need == 0:
+                break
+            if not picked_mask >> pick & 1:
+                picks.append(pick)
+                picked_mask |= 1 << pick
                 still_need -= 1
-            refill.remove(pick)
 
-    # 取得アイテムを使用済みに登録
-    for c in chosen:
-        _mark_used(dedup_key, hash(c))
-    return chosen
+    for i in picks:
+        used_mask |= 1 << i
+    return picks, used_mask
+
+def _sample_without_used(
+    items: Sequence[str],
+    n: int,
+    rng: random.Random,
+    dedup_key: str,
+) -> List[str]:
+    """
+    使用済みを避けて n 件サンプルを返す。
+    - 使用済みはプール内インデックスのビットマスクで管理（hash(str) はプロセス毎に変わるため）
+    - 抽出ロジックは _draw に集約し、取得したアイテムは使用済みにマークする
+    """
+    picks, used_mask = _draw(len(items), _get_used_mask(dedup_key), n, rng)
+    _set_used_mask(dedup_key, used_mask)
+    return [items[i] for i in picks]
 
 # ============================================================================ #
 # プロンプト・ビルダ
 # ============================================================================ #
-def _aa36_pool(level: str) -> List[str]:
+# レベル別プールは import 時に一度だけ確定させ、再実行ごとのスライス生成を避ける。
+# constants 側のプールは tuple なので、スライスもそのまま不変な tuple になる。
+_AA36_POOLS: Dict[str, Tuple[str, ...]] = {
+    "beginner": AA36_QUESTIONS[0:12],
+    "intermediate": AA36_QUESTIONS[12:24],
+    "advanced": AA36_QUESTIONS[24:36],
+    "business": AA36_BUSINESS_REWRITE,
+}
+_AA36_FALLBACK: Tuple[str, ...] = AA36_QUESTIONS
+
+_ITTAKU_POOLS: Dict[str, Tuple[str, ...]] = {
+    "beginner": ITTAKU_TOPICS,
+    "topic_only": ITTAKU_TOPICS,
+    "business_topic": ITTAKU_BUSINESS_TOPICS,
+}
+
+_VILLAIN_POOLS: Dict[str, Tuple[str, ...]] = {
+    "criminal": CRIMINAL_TEMPLATE,
+    "claimer": COMPLAINER_TEMPLATE,
+}
+
+
+def _aa36_pool(level: str) -> Tuple[str, ...]:
     """
     アーサー・アーロン36の質問のうち、レベルに応じた配列を返す。
     - beginner: 1–12
     - intermediate: 13–24
     - advanced: 25–36
     - business: ビジネス言い換え配列
+    - 万一のフォールバックは全件
     """
-    if level == "business":
-        return AA36_BUSINESS_REWRITE
-    if level == "beginner":
-        return AA36_QUESTIONS[0:12]
-    if level == "intermediate":
-        return AA36_QUESTIONS[12:24]
-    if level == "advanced":
-        return AA36_QUESTIONS[24:36]
-    # 万一のフォールバック（全件）
-    return AA36_QUESTIONS
+    return _AA36_POOLS.get(level, _AA36_FALLBACK)
 
-def _ittaku_pool(level: str) -> List[str]:
+def _ittaku_pool(level: str) -> Tuple[str, ...]:
     """
     結論！実際それ一択のテーマ配列を返す。
     """
-    if level == "beginner":
-        return ITTAKU_TOPICS
-    if level == "topic_only":
-        return ITTAKU_TOPICS
-    if level == "business_topic":
-        return ITTAKU_BUSINESS_TOPICS
-    # フォールバック
-    return ITTAKU_TOPICS
+    return _ITTAKU_POOLS.get(level, _ITTAKU_POOLS["topic_only"])
 
-def _villain_pool(level: str) -> List[str]:
+def _villain_pool(level: str) -> Tuple[str, ...]:
     """
     悪事の正当化テンプレート（犯罪／クレーマー）を返す。
     """
-    if level == "criminal":
-        return CRIMINAL_TEMPLATE
-    if level == "claimer":
-        return COMPLAINER_TEMPLATE
-    # フォールバック
-    return CRIMINAL_TEMPLATE
+    return _VILLAIN_POOLS.get(level, _VILLAIN_POOLS["criminal"])
 
 # ============================================================================ #
 # 外部公開API：お題生成